@@ -1,18 +1,43 @@
 from __future__ import annotations
 
 import argparse
+import gzip
 import json
+import os
 import sqlite3
 import urllib.request
-from collections import defaultdict
+from collections import defaultdict, deque
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional accelerator, stdlib json is the fallback
+    orjson = None
+
 SYSTEM_DIR = Path(__file__).resolve().parent.parent
 DEFAULT_DB_PATH = SYSTEM_DIR / "database.sqlite"
 DEFAULT_CONFIG_PATH = SYSTEM_DIR / "config.json"
 DEFAULT_OUTPUT_PATH = SYSTEM_DIR.parent / "dashboard" / "data" / "dashboard-data.json"
 DEFAULT_USD_TO_EUR_RATE = 0.92
+SCORE_SERIES_MAX_POINTS = 80
+JSON_CACHE_MAX_LENGTH = 8192
+EXPORT_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+EXPORT_INDEX_STATEMENTS = (
+    "CREATE INDEX IF NOT EXISTS idx_trades_asset_id ON trades(asset, id)",
+    "CREATE INDEX IF NOT EXISTS idx_trades_created_at ON trades(created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_decisions_created_at ON decisions(created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_decisions_agent_action_created ON decisions(agent_id, action, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_events_created_at ON events(created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_events_type_id ON events(event_type, id)",
+)
 
 
 def export_dashboard_snapshot(
@@ -23,6 +48,7 @@ def export_dashboard_snapshot(
     trades_limit: int = 250,
     events_limit: int = 120,
     lookback_days: int = 3,
+    pretty: bool = False,
 ):
     db_file = Path(db_path)
     if not db_file.exists():
@@ -38,11 +64,17 @@ def export_dashboard_snapshot(
     cutoff_recent = (now_utc - timedelta(days=lookback_days)).isoformat()
 
     conn = sqlite3.connect(str(db_file))
-    conn.row_factory = sqlite3.Row
     try:
+        _prepare_export_connection(conn)
         assets = _extract_assets(conn, config)
-        market_snapshot = _fetch_market_snapshot(conn, assets, base_currency=base_currency)
-        last_prices = _derive_last_prices(conn, assets, market_snapshot)
+        last_trade_prices = _fetch_last_trade_prices(conn, assets)
+        market_snapshot = _fetch_market_snapshot(
+            conn,
+            assets,
+            last_trade_prices=last_trade_prices,
+            base_currency=base_currency,
+        )
+        last_prices = _derive_last_prices(assets, market_snapshot, last_trade_prices)
 
         agents = _fetch_agents(conn)
         portfolios = _fetch_portfolios(conn)
@@ -58,10 +90,8 @@ def export_dashboard_snapshot(
         )
         events_recent = _fetch_recent_events(conn, limit=events_limit, since=cutoff_recent)
 
-        decisions_all = _fetch_action_counts(conn, "decisions")
-        decisions_24h = _fetch_action_counts(conn, "decisions", since=cutoff_24h)
-        trades_all = _fetch_trade_stats(conn)
-        trades_24h = _fetch_trade_stats(conn, since=cutoff_24h)
+        decisions_all, decisions_24h = _fetch_action_counts(conn, recent_since=cutoff_24h)
+        trades_all, trades_24h = _fetch_trade_stats(conn, recent_since=cutoff_24h)
 
         agent_payload = _build_agent_payload(
             agents=agents,
@@ -108,7 +138,7 @@ def export_dashboard_snapshot(
 
     out_file = Path(output_path)
     out_file.parent.mkdir(parents=True, exist_ok=True)
-    out_file.write_text(json.dumps(payload, ensure_ascii=True, indent=2), encoding="utf-8")
+    _write_json_atomic(out_file, payload, pretty=pretty)
     return str(out_file)
 
 
@@ -147,6 +177,11 @@ def main():
         default=3,
         help="Maximum age in days for recent decisions/trades/events",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the JSON output (compact by default)",
+    )
     args = parser.parse_args()
 
     output_file = export_dashboard_snapshot(
@@ -157,10 +192,28 @@ def main():
         trades_limit=max(50, args.trades_limit),
         events_limit=max(20, args.events_limit),
         lookback_days=max(1, args.lookback_days),
+        pretty=args.pretty,
     )
     print(f"Dashboard export written to: {output_file}")
 
 
+def _prepare_export_connection(conn):
+    # Tuning and indexes are best effort: a locked or read-only database must not block the export.
+    for pragma in EXPORT_CONNECTION_PRAGMAS:
+        try:
+            conn.execute(pragma)
+        except sqlite3.OperationalError:
+            pass
+
+    try:
+        with conn:
+            conn.execute("BEGIN")
+            for statement in EXPORT_INDEX_STATEMENTS:
+                conn.execute(statement)
+    except sqlite3.OperationalError:
+        pass
+
+
 def _build_agent_payload(
     agents,
     portfolios,
@@ -178,24 +231,19 @@ def _build_agent_payload(
         portfolio = portfolios.get(agent_id, {"cash_balance": 0.0, "initial_balance": 0.0})
         cash_balance = float(portfolio["cash_balance"])
         initial_balance = float(portfolio["initial_balance"])
-        positions = positions_by_agent.get(agent_id, [])
-        positions_value = sum(float(position["market_value_eur"]) for position in positions)
+        allocations = positions_by_agent.get(agent_id, [])
+        positions_value = sum(position["market_value_eur"] for position in allocations)
         equity = cash_balance + positions_value
         pnl_abs = equity - initial_balance
         pnl_pct = (pnl_abs / initial_balance) if initial_balance else 0.0
 
+        # Positions are built per export, so weights are added in place and values rounded only here.
         position_weight_denominator = equity if equity > 0 else 1.0
-        allocations = [
-            {
-                **position,
-                "weight_pct": round(
-                    (float(position["market_value_eur"]) / position_weight_denominator) * 100.0,
-                    4,
-                ),
-            }
-            for position in positions
-        ]
-        allocations.sort(key=lambda row: float(row["market_value_eur"]), reverse=True)
+        for position in allocations:
+            market_value = position["market_value_eur"]
+            position["weight_pct"] = round((market_value / position_weight_denominator) * 100.0, 4)
+            position["market_value_eur"] = round(market_value, 8)
+        allocations.sort(key=itemgetter("market_value_eur"), reverse=True)
 
         trade_info_all = trades_all.get(agent_id, {"count": 0, "fees": 0.0, "last_trade_at": None})
         trade_info_24h = trades_24h.get(agent_id, {"count": 0, "fees": 0.0, "last_trade_at": None})
@@ -339,16 +387,16 @@ def _fetch_agents(conn):
         FROM agents
         ORDER BY id
         """
-    ).fetchall()
+    )
     out = []
-    for row in rows:
+    for agent_id, name, risk_profile, assets, timeframes in rows:
         out.append(
             {
-                "id": row["id"],
-                "name": row["name"],
-                "risk_profile": row["risk_profile"],
-                "assets": _safe_json_loads(row["assets"], []),
-                "timeframes": _safe_json_loads(row["timeframes"], []),
+                "id": agent_id,
+                "name": name,
+                "risk_profile": risk_profile,
+                "assets": _safe_json_loads(assets, []),
+                "timeframes": _safe_json_loads(timeframes, []),
             }
         )
     return out
@@ -360,12 +408,12 @@ def _fetch_portfolios(conn):
         SELECT agent_id, cash_balance, initial_balance
         FROM portfolios
         """
-    ).fetchall()
+    )
     out = {}
-    for row in rows:
-        out[row["agent_id"]] = {
-            "cash_balance": float(row["cash_balance"]),
-            "initial_balance": float(row["initial_balance"]),
+    for agent_id, cash_balance, initial_balance in rows:
+        out[agent_id] = {
+            "cash_balance": float(cash_balance),
+            "initial_balance": float(initial_balance),
         }
     return out
 
@@ -377,19 +425,22 @@ def _fetch_positions(conn, last_prices):
         FROM positions
         ORDER BY agent_id, asset
         """
-    ).fetchall()
+    )
     out = defaultdict(list)
-    for row in rows:
-        market_price = float(last_prices.get(row["asset"], row["avg_price"]))
-        market_value = float(row["quantity"]) * market_price
-        out[row["agent_id"]].append(
+    price_for = last_prices.get
+    for agent_id, asset, quantity, avg_price, updated_at in rows:
+        quantity = float(quantity)
+        avg_price = float(avg_price)
+        market_price = float(price_for(asset, avg_price))
+        market_value = quantity * market_price
+        out[agent_id].append(
             {
-                "asset": row["asset"],
-                "quantity": round(float(row["quantity"]), 10),
-                "avg_price": round(float(row["avg_price"]), 10),
+                "asset": asset,
+                "quantity": round(quantity, 10),
+                "avg_price": round(avg_price, 10),
                 "market_price": round(market_price, 10),
-                "market_value_eur": round(market_value, 8),
-                "updated_at": row["updated_at"],
+                "market_value_eur": market_value,
+                "updated_at": updated_at,
             }
         )
     return out
@@ -406,20 +457,29 @@ def _fetch_recent_decisions(conn, limit: int, since: str | None = None):
         params.append(since)
     query += " ORDER BY id DESC LIMIT ?"
     params.append(limit)
-    rows = conn.execute(query, tuple(params)).fetchall()
     out = []
-    for row in rows:
+    for (
+        decision_id,
+        agent_id,
+        asset,
+        timeframe,
+        regime,
+        score,
+        action,
+        rationale,
+        created_at,
+    ) in conn.execute(query, tuple(params)):
         out.append(
             {
-                "id": int(row["id"]),
-                "agent_id": row["agent_id"],
-                "asset": row["asset"],
-                "timeframe": row["timeframe"],
-                "regime": row["regime"],
-                "score": round(float(row["score"]), 4),
-                "action": row["action"],
-                "rationale": _safe_json_loads(row["rationale"], {}),
-                "created_at": row["created_at"],
+                "id": int(decision_id),
+                "agent_id": agent_id,
+                "asset": asset,
+                "timeframe": timeframe,
+                "regime": regime,
+                "score": round(float(score), 4),
+                "action": action,
+                "rationale": _safe_json_loads(rationale, {}),
+                "created_at": created_at,
             }
         )
     return out
@@ -441,28 +501,39 @@ def _fetch_recent_trades(
         params.append(since)
     query += " ORDER BY id DESC LIMIT ?"
     params.append(limit)
-    rows = conn.execute(query, tuple(params)).fetchall()
     realized_pnl_by_trade_id = realized_pnl_by_trade_id or {}
     out = []
-    for row in rows:
-        trade_id = int(row["id"])
+    for (
+        trade_id,
+        agent_id,
+        asset,
+        side,
+        quantity,
+        price,
+        notional,
+        fee,
+        reason,
+        dry_run,
+        created_at,
+    ) in conn.execute(query, tuple(params)):
+        trade_id = int(trade_id)
         realized_pnl = None
         if trade_id in realized_pnl_by_trade_id:
             realized_pnl = round(float(realized_pnl_by_trade_id.get(trade_id, 0.0)), 8)
         out.append(
             {
                 "id": trade_id,
-                "agent_id": row["agent_id"],
-                "asset": row["asset"],
-                "side": row["side"],
-                "quantity": round(float(row["quantity"]), 10),
-                "price": round(float(row["price"]), 10),
-                "notional_eur": round(float(row["notional"]), 8),
-                "fee_eur": round(float(row["fee"]), 8),
+                "agent_id": agent_id,
+                "asset": asset,
+                "side": side,
+                "quantity": round(float(quantity), 10),
+                "price": round(float(price), 10),
+                "notional_eur": round(float(notional), 8),
+                "fee_eur": round(float(fee), 8),
                 "realized_pnl_eur": realized_pnl,
-                "reason": row["reason"],
-                "dry_run": bool(int(row["dry_run"])),
-                "created_at": row["created_at"],
+                "reason": reason,
+                "dry_run": bool(int(dry_run)),
+                "created_at": created_at,
             }
         )
     return out
@@ -475,20 +546,20 @@ def _compute_realized_pnl_by_trade_id(conn):
         FROM trades
         ORDER BY id ASC
         """
-    ).fetchall()
+    )
 
     lots_by_key = defaultdict(list)
     realized_pnl_by_trade_id = {}
     eps = 1e-10
 
-    for row in rows:
-        trade_id = int(row["id"])
-        agent_id = str(row["agent_id"] or "")
-        asset = str(row["asset"] or "").upper()
-        side = str(row["side"] or "").upper()
-        quantity = float(row["quantity"] or 0.0)
-        price = float(row["price"] or 0.0)
-        fee = float(row["fee"] or 0.0)
+    for trade_id, agent_id, asset, side, quantity, price, fee in rows:
+        trade_id = int(trade_id)
+        agent_id = str(agent_id or "")
+        asset = str(asset or "").upper()
+        side = str(side or "").upper()
+        quantity = float(quantity or 0.0)
+        price = float(price or 0.0)
+        fee = float(fee or 0.0)
 
         if not agent_id or not asset or quantity <= 0.0 or price <= 0.0:
             continue
@@ -568,69 +639,89 @@ def _fetch_recent_events(conn, limit: int, since: str | None = None):
         params.append(since)
     query += " ORDER BY id DESC LIMIT ?"
     params.append(limit)
-    rows = conn.execute(query, tuple(params)).fetchall()
     out = []
-    for row in rows:
+    for event_id, event_type, payload, created_at in conn.execute(query, tuple(params)):
         out.append(
             {
-                "id": int(row["id"]),
-                "event_type": row["event_type"],
-                "payload": _safe_json_loads(row["payload"], row["payload"]),
-                "created_at": row["created_at"],
+                "id": int(event_id),
+                "event_type": event_type,
+                "payload": _safe_json_loads(payload, payload),
+                "created_at": created_at,
             }
         )
     return out
 
 
-def _fetch_action_counts(conn, table_name: str, since: str | None = None):
-    if table_name not in {"decisions"}:
-        raise ValueError(f"Unsupported table for action count: {table_name}")
-
-    query = "SELECT agent_id, action, COUNT(*) as count FROM decisions"
-    params = []
-    if since:
-        query += " WHERE created_at >= ?"
-        params.append(since)
-    query += " GROUP BY agent_id, action"
-
-    rows = conn.execute(query, tuple(params)).fetchall()
-    out = defaultdict(_empty_action_count)
-    for row in rows:
-        bucket = out[row["agent_id"]]
-        action = row["action"].upper()
-        if action not in bucket:
-            bucket[action] = 0
-        bucket[action] += int(row["count"])
-        bucket["total"] += int(row["count"])
-    return dict(out)
+def _fetch_action_counts(conn, recent_since: str):
+    rows = conn.execute(
+        """
+        SELECT
+            agent_id,
+            action,
+            COUNT(*) AS count,
+            SUM(CASE WHEN created_at >= ? THEN 1 ELSE 0 END) AS recent_count
+        FROM decisions
+        GROUP BY agent_id, action
+        """,
+        (recent_since,),
+    )
+    out_all = defaultdict(_empty_action_count)
+    out_recent = defaultdict(_empty_action_count)
+    for agent_id, action, total_count, recent_count in rows:
+        action = action.upper()
+        for out, count in ((out_all, int(total_count)), (out_recent, int(recent_count))):
+            if count <= 0:
+                continue
+            bucket = out[agent_id]
+            if action not in bucket:
+                bucket[action] = 0
+            bucket[action] += count
+            bucket["total"] += count
+    return dict(out_all), dict(out_recent)
 
 
-def _fetch_trade_stats(conn, since: str | None = None):
-    query = """
+def _fetch_trade_stats(conn, recent_since: str):
+    rows = conn.execute(
+        """
         SELECT
             agent_id,
             COUNT(*) AS count,
             COALESCE(SUM(fee), 0) AS fees,
-            MAX(created_at) AS last_trade_at
+            MAX(created_at) AS last_trade_at,
+            SUM(CASE WHEN created_at >= ? THEN 1 ELSE 0 END) AS recent_count,
+            COALESCE(SUM(CASE WHEN created_at >= ? THEN fee ELSE 0 END), 0) AS recent_fees,
+            MAX(CASE WHEN created_at >= ? THEN created_at END) AS recent_last_trade_at
         FROM trades
-    """
-    params = []
-    if since:
-        query += " WHERE created_at >= ?"
-        params.append(since)
-    query += " GROUP BY agent_id"
-    rows = conn.execute(query, tuple(params)).fetchall()
-    out = {}
-    for row in rows:
-        out[row["agent_id"]] = {
-            "count": int(row["count"]),
-            "fees": float(row["fees"]),
-            "last_trade_at": row["last_trade_at"],
+        GROUP BY agent_id
+        """,
+        (recent_since, recent_since, recent_since),
+    )
+    out_all = {}
+    out_recent = {}
+    for (
+        agent_id,
+        count,
+        fees,
+        last_trade_at,
+        recent_count,
+        recent_fees,
+        recent_last_trade_at,
+    ) in rows:
+        out_all[agent_id] = {
+            "count": int(count),
+            "fees": float(fees),
+            "last_trade_at": last_trade_at,
         }
-    return out
+        if int(recent_count) > 0:
+            out_recent[agent_id] = {
+                "count": int(recent_count),
+                "fees": float(recent_fees),
+                "last_trade_at": recent_last_trade_at,
+            }
+    return out_all, out_recent
 
 
-def _fetch_market_snapshot(conn, assets, base_currency: str = "EUR"):
+def _fetch_market_snapshot(conn, assets, last_trade_prices, base_currency: str = "EUR"):
     row = conn.execute(
         """
         SELECT payload
@@ -641,7 +732,7 @@ def _fetch_market_snapshot(conn, assets, base_currency: str = "EUR"):
         """
     ).fetchone()
     if row:
-        payload = _safe_json_loads(row["payload"], {})
+        payload = _safe_json_loads(row[0], {})
         snapshot = payload.get("market_snapshot")
         data_quality = payload.get("data_quality", {})
         snapshot_currency = str(data_quality.get("market_currency", "USD")).upper()
@@ -671,20 +762,10 @@ def _fetch_market_snapshot(conn, assets, base_currency: str = "EUR"):
     # Fallback from latest trades if no cycle summary exists yet.
     out = []
     for asset in assets:
-        trade_row = conn.execute(
-            """
-            SELECT price
-            FROM trades
-            WHERE asset = ?
-            ORDER BY id DESC
-            LIMIT 1
-            """,
-            (asset,),
-        ).fetchone()
         out.append(
             {
                 "asset": asset,
-                "last_price": float(trade_row["price"]) if trade_row else 0.0,
+                "last_price": float(last_trade_prices.get(asset, 0.0)),
                 "price_change_pct_24h": 0.0,
                 "quote_volume_24h": 0.0,
             }
@@ -692,23 +773,34 @@ def _fetch_market_snapshot(conn, assets, base_currency: str = "EUR"):
     return out
 
 
-def _derive_last_prices(conn, assets, market_snapshot):
+def _fetch_last_trade_prices(conn, assets):
+    if not assets:
+        return {}
+
+    placeholders = ",".join("?" * len(assets))
+    rows = conn.execute(
+        f"""
+        SELECT asset, price
+        FROM trades
+        WHERE id IN (
+            SELECT MAX(id)
+            FROM trades
+            WHERE asset IN ({placeholders})
+            GROUP BY asset
+        )
+        """,
+        tuple(assets),
+    )
+    return {asset: float(price) for asset, price in rows}
+
+
+def _derive_last_prices(assets, market_snapshot, last_trade_prices):
     out = {item["asset"]: float(item["last_price"]) for item in market_snapshot if item["last_price"] > 0}
     for asset in assets:
         if asset in out:
             continue
-        row = conn.execute(
-            """
-            SELECT price
-            FROM trades
-            WHERE asset = ?
-            ORDER BY id DESC
-            LIMIT 1
-            """,
-            (asset,),
-        ).fetchone()
-        if row:
-            out[asset] = float(row["price"])
+        if asset in last_trade_prices:
+            out[asset] = last_trade_prices[asset]
     return out
 
 
@@ -718,10 +810,14 @@ def _http_get_json(url: str, timeout: int = 8):
         headers={
             "User-Agent": "cryptoMaster/1.0",
             "Accept": "application/json",
+            "Accept-Encoding": "gzip",
         },
     )
     with urllib.request.urlopen(request, timeout=timeout) as response:
-        return json.loads(response.read().decode("utf-8"))
+        body = response.read()
+        if str(response.headers.get("Content-Encoding", "")).lower() == "gzip":
+            body = gzip.decompress(body)
+    return _parse_json(body)
 
 
 def _fetch_usd_to_eur_rate(timeout: int = 8):
@@ -753,23 +849,19 @@ def _fetch_usd_to_eur_rate(timeout: int = 8):
 
 
 def _build_score_series(decisions_recent, assets):
-    series = {asset: [] for asset in assets}
-    ordered = list(reversed(decisions_recent))
-    for row in ordered:
-        asset = row["asset"]
-        if asset not in series:
+    series = {asset: deque(maxlen=SCORE_SERIES_MAX_POINTS) for asset in assets}
+    for row in reversed(decisions_recent):
+        points = series.get(row["asset"])
+        if points is None:
             continue
-        series[asset].append(
+        points.append(
             {
                 "time": row["created_at"],
                 "score": float(row["score"]),
                 "action": row["action"],
             }
         )
-    for asset in assets:
-        if len(series[asset]) > 80:
-            series[asset] = series[asset][-80:]
-    return series
+    return {asset: list(points) for asset, points in series.items()}
 
 
 def _build_market_history(conn, assets):
@@ -784,11 +876,11 @@ def _build_market_history(conn, assets):
         ORDER BY id DESC
         LIMIT 720
         """
-    ).fetchall()
+    )
     history = {asset: [] for asset in assets}
     latest_ts = 0
-    for row in rows:
-        payload = _safe_json_loads(row["payload"], {})
+    for (raw_payload,) in rows:
+        payload = _safe_json_loads(raw_payload, {})
         ts_str = payload.get("timestamp") or payload.get("created_at")
         parsed_ts = _safe_parse_timestamp(ts_str)
         if not parsed_ts:
@@ -816,7 +908,7 @@ def _build_market_history(conn, assets):
 
     # ensure ascending order and trim
     for asset in assets:
-        points = sorted(history[asset], key=lambda entry: entry["ts"])
+        points = sorted(history[asset], key=itemgetter("ts"))
         history[asset] = points[-240:]
 
     now_ts = latest_ts
@@ -876,7 +968,7 @@ def _extract_assets(conn, config):
         """
     ).fetchone()
     if latest_summary:
-        payload = _safe_json_loads(latest_summary["payload"], {})
+        payload = _safe_json_loads(latest_summary[0], {})
         snapshot = payload.get("market_snapshot", {})
         if isinstance(snapshot, dict):
             assets = [str(asset).upper() for asset in snapshot.keys() if str(asset).strip()]
@@ -893,7 +985,7 @@ def _extract_assets(conn, config):
         """
     ).fetchone()
     if rotation:
-        payload = _safe_json_loads(rotation["payload"], {})
+        payload = _safe_json_loads(rotation[0], {})
         assets = payload.get("assets", [])
         if isinstance(assets, list) and assets:
             return [str(asset).upper() for asset in assets if str(asset).strip()]
@@ -914,7 +1006,7 @@ def _extract_news_and_sentiment(conn):
     if not row:
         return {"news_feed": [], "sentiment": {}}
 
-    payload = _safe_json_loads(row["payload"], {})
+    payload = _safe_json_loads(row[0], {})
     data_quality = payload.get("data_quality", {}) if isinstance(payload, dict) else {}
     news_feed = data_quality.get("news_items", [])
     if not isinstance(news_feed, list):
@@ -933,6 +1025,27 @@ def _extract_news_and_sentiment(conn):
     }
 
 
+def _write_json_atomic(out_file: Path, payload, pretty: bool = False):
+    # Write next to the target then swap, so the dashboard never fetches a half-written file.
+    tmp_file = out_file.with_name(out_file.name + ".tmp")
+    try:
+        if orjson is not None:
+            tmp_file.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 if pretty else 0))
+        elif pretty:
+            # Indented output never uses the C encoder, so stream chunks instead of building one string.
+            encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+            with tmp_file.open("w", encoding="utf-8") as handle:
+                for chunk in encoder.iterencode(payload):
+                    handle.write(chunk)
+        else:
+            with tmp_file.open("w", encoding="utf-8") as handle:
+                handle.write(json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+        os.replace(tmp_file, out_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
 def _load_json_file(path: str | None):
     if not path:
         return {}
@@ -951,17 +1064,31 @@ def _safe_json_loads(value, default):
     if isinstance(value, (dict, list)):
         return value
     try:
-        return json.loads(value)
+        if isinstance(value, str) and len(value) < JSON_CACHE_MAX_LENGTH:
+            return _parse_json_cached(value)
+        return _parse_json(value)
     except Exception:
         return default
 
 
-def _empty_action_count():
-    return {"BUY": 0, "SELL": 0, "HOLD": 0, "total": 0}
+# Decoded values are shared between rows with identical text: callers must treat them as read-only.
+@lru_cache(maxsize=2048)
+def _parse_json_cached(value: str):
+    return _parse_json(value)
 
 
-def _utc_now():
-    return datetime.now(timezone.utc).isoformat()
+def _parse_json(value):
+    if orjson is not None:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which stdlib json.dumps writes by default.
+            pass
+    return json.loads(value)
+
+
+def _empty_action_count():
+    return {"BUY": 0, "SELL": 0, "HOLD": 0, "total": 0}
 
 
 def _resolve_path(path_str: str):